@@ -7,16 +7,21 @@ Run: python3 generate_xcodeproj.py
 Then: open EMCopilot.xcodeproj
 """
 
+import io
 import os
-import uuid
 import json
+import hashlib
+import binascii
+from concurrent.futures import ThreadPoolExecutor
 
 # ---------------------------------------------------------------------------
 # UUID helpers
 # ---------------------------------------------------------------------------
 
-def make_uuid():
-    return uuid.uuid4().hex[:24].upper()
+def _uuid_pool(n):
+    # One urandom read, sliced into 24-char (96-bit) uppercase hex IDs
+    raw = os.urandom(12 * n)
+    return [binascii.hexlify(raw[i*12:(i+1)*12]).decode("ascii").upper() for i in range(n)]
 
 # ---------------------------------------------------------------------------
 # Source file registry
@@ -74,330 +79,410 @@ SWIFT_VERSION   = "5.10"
 # Generate UUIDs for every object we'll reference
 # ---------------------------------------------------------------------------
 
-PROJECT_UUID            = make_uuid()
-MAIN_GROUP_UUID         = make_uuid()
-PRODUCTS_GROUP_UUID     = make_uuid()
-TARGET_UUID             = make_uuid()
-PRODUCT_REF_UUID        = make_uuid()
-
-SOURCES_PHASE_UUID      = make_uuid()
-RESOURCES_PHASE_UUID    = make_uuid()
-FRAMEWORKS_PHASE_UUID   = make_uuid()
-
-DEBUG_CONFIG_UUID       = make_uuid()
-RELEASE_CONFIG_UUID     = make_uuid()
-TARGET_DEBUG_CFG_UUID   = make_uuid()
-TARGET_RELEASE_CFG_UUID = make_uuid()
-PROJECT_CFGLIST_UUID    = make_uuid()
-TARGET_CFGLIST_UUID     = make_uuid()
-
-SWIFTDATA_FW_REF_UUID   = make_uuid()
-SWIFTDATA_BUILD_UUID    = make_uuid()
+# IDs are reused from the cache sidecar when present so they stay stable
+# across runs; anything not in the cache is drawn from a fresh pool
+# (16 fixed objects + a fileRef and buildFile per source/resource file).
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".emcopilot_cache.json")
+
+def _is_uuid(value):
+    return (isinstance(value, str) and len(value) == 24
+            and all(c in "0123456789ABCDEF" for c in value))
+
+def _load_cache():
+    # Anything unreadable or malformed is treated as no cache
+    try:
+        with open(CACHE_PATH, "rb") as f:
+            cache = json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    ids = cache.get("uuids")
+    cache["uuids"] = {k: v for k, v in ids.items() if _is_uuid(v)} if isinstance(ids, dict) else {}
+    return cache
+
+_cache       = _load_cache()
+_cached_ids  = _cache["uuids"] if _cache else {}
+_fresh_uuid  = _uuid_pool(16 + 2 * (len(SOURCE_FILES) + len(RESOURCE_FILES))).pop
+uuids        = {}   # name -> UUID, written back to the cache
+
+def make_uuid(name):
+    uid = _cached_ids.get(name) or _fresh_uuid()
+    uuids[name] = uid
+    return uid
+
+PROJECT_UUID            = make_uuid("PROJECT_UUID")
+MAIN_GROUP_UUID         = make_uuid("MAIN_GROUP_UUID")
+PRODUCTS_GROUP_UUID     = make_uuid("PRODUCTS_GROUP_UUID")
+TARGET_UUID             = make_uuid("TARGET_UUID")
+PRODUCT_REF_UUID        = make_uuid("PRODUCT_REF_UUID")
+
+SOURCES_PHASE_UUID      = make_uuid("SOURCES_PHASE_UUID")
+RESOURCES_PHASE_UUID    = make_uuid("RESOURCES_PHASE_UUID")
+FRAMEWORKS_PHASE_UUID   = make_uuid("FRAMEWORKS_PHASE_UUID")
+
+DEBUG_CONFIG_UUID       = make_uuid("DEBUG_CONFIG_UUID")
+RELEASE_CONFIG_UUID     = make_uuid("RELEASE_CONFIG_UUID")
+TARGET_DEBUG_CFG_UUID   = make_uuid("TARGET_DEBUG_CFG_UUID")
+TARGET_RELEASE_CFG_UUID = make_uuid("TARGET_RELEASE_CFG_UUID")
+PROJECT_CFGLIST_UUID    = make_uuid("PROJECT_CFGLIST_UUID")
+TARGET_CFGLIST_UUID     = make_uuid("TARGET_CFGLIST_UUID")
+
+SWIFTDATA_FW_REF_UUID   = make_uuid("SWIFTDATA_FW_REF_UUID")
+SWIFTDATA_BUILD_UUID    = make_uuid("SWIFTDATA_BUILD_UUID")
 
 # Per-file UUIDs
 file_refs   = {}   # path -> fileRef UUID
 build_files = {}   # path -> buildFile UUID
 for f in SOURCE_FILES:
-    file_refs[f]   = make_uuid()
-    build_files[f] = make_uuid()
+    file_refs[f]   = make_uuid(f"fileRef:{f}")
+    build_files[f] = make_uuid(f"buildFile:{f}")
 for r in RESOURCE_FILES:
-    file_refs[r]   = make_uuid()
-    build_files[r] = make_uuid()
+    file_refs[r]   = make_uuid(f"fileRef:{r}")
+    build_files[r] = make_uuid(f"buildFile:{r}")
+
+# (path, name, fileRef UUID, buildFile UUID), in registry order, shared by
+# every section that walks the file list
+_FILE_ENTRIES = [(p, os.path.basename(p), file_refs[p], build_files[p])
+                 for p in SOURCE_FILES + RESOURCE_FILES]
 
 ASSETS_XCASSETS = "EMCopilot/Resources/Assets.xcassets"
 
+# ---------------------------------------------------------------------------
+# Regeneration cache
+# ---------------------------------------------------------------------------
+
+def cache_key():
+    # Inputs that shape the output, plus this script itself so template or
+    # build-setting edits also force a rebuild
+    with open(__file__, "rb") as f:
+        script = f.read()
+    inputs = json.dumps([SOURCE_FILES, RESOURCE_FILES, APP_NAME, BUNDLE_ID_BASE,
+                         MACOS_DEPLOY, IOS_DEPLOY, SWIFT_VERSION], sort_keys=True)
+    return hashlib.blake2b(inputs.encode("utf-8") + script).hexdigest()
+
+def save_cache(key):
+    with open(CACHE_PATH, "wb") as f:
+        f.write(json.dumps({"key": key, "uuids": uuids}, indent=2, sort_keys=True).encode("utf-8"))
+
 # ---------------------------------------------------------------------------
 # Build the project.pbxproj content
 # ---------------------------------------------------------------------------
 
-def indent(n, s):
-    return "\t" * n + s
+# Per-file line templates (one line emitted per file in each section)
+_BUILDFILE_TMPL    = "\t\t{uid} /* {name} in Sources */ = {{isa = PBXBuildFile; fileRef = {ref} /* {name} */; }};\n"
+_FILEREF_TMPL      = "\t\t{uid} /* {name} */ = {{isa = PBXFileReference; lastKnownFileType = {file_type}; name = {name}; path = {path}; sourceTree = \"<group>\"; }};\n"
+_GROUP_CHILD_TMPL  = "\t\t\t\t{uid} /* {name} */,\n"
+_SOURCES_FILE_TMPL = "\t\t\t\t{uid} /* {name} in Sources */,\n"
+
+# Build configurations: one template, settings kept as data per configuration
+_XCCONFIG_TMPL  = "\t\t{uid} /* {name} */ = {{\n\t\t\tisa = XCBuildConfiguration;\n\t\t\tbuildSettings = {{\n{settings}\t\t\t}};\n\t\t\tname = {name};\n\t\t}};\n"
+_SETTING_TMPL   = "\t\t\t\t{key} = {value};\n"
+
+def _settings_block(settings):
+    return "".join(_SETTING_TMPL.format(key=k, value=v) for k, v in settings.items())
+
+_PROJECT_SETTINGS = {
+    "Debug": {
+        "ALWAYS_SEARCH_USER_PATHS": "NO",
+        "CLANG_ENABLE_MODULES": "YES",
+        "COPY_PHASE_STRIP": "NO",
+        "DEBUG_INFORMATION_FORMAT": "dwarf",
+        "ENABLE_STRICT_OBJC_MSGSEND": "YES",
+        "ENABLE_TESTABILITY": "YES",
+        "GCC_C_LANGUAGE_STANDARD": "gnu17",
+        "GCC_DYNAMIC_NO_PIC": "NO",
+        "GCC_OPTIMIZATION_LEVEL": "0",
+        "GCC_PREPROCESSOR_DEFINITIONS": '("DEBUG=1", "$(inherited)")',
+        "MTL_ENABLE_DEBUG_INFO": "INCLUDE_SOURCE",
+        "MTL_FAST_MATH": "YES",
+        "ONLY_ACTIVE_ARCH": "YES",
+        "SWIFT_ACTIVE_COMPILATION_CONDITIONS": "DEBUG",
+        "SWIFT_OPTIMIZATION_LEVEL": '"-Onone"',
+    },
+    "Release": {
+        "ALWAYS_SEARCH_USER_PATHS": "NO",
+        "CLANG_ENABLE_MODULES": "YES",
+        "COPY_PHASE_STRIP": "NO",
+        "DEBUG_INFORMATION_FORMAT": '"dwarf-with-dsym"',
+        "ENABLE_NS_ASSERTIONS": "NO",
+        "ENABLE_STRICT_OBJC_MSGSEND": "YES",
+        "GCC_C_LANGUAGE_STANDARD": "gnu17",
+        "MTL_ENABLE_DEBUG_INFO": "NO",
+        "MTL_FAST_MATH": "YES",
+        "SWIFT_COMPILATION_MODE": "wholemodule",
+        "SWIFT_OPTIMIZATION_LEVEL": '"-O"',
+    },
+}
+
+# Target settings are the same for Debug and Release
+_TARGET_SETTINGS = {
+    "ASSETCATALOG_COMPILER_APPICON_NAME": "AppIcon",
+    "ASSETCATALOG_COMPILER_GLOBAL_ACCENT_COLOR_NAME": "AccentColor",
+    "COMBINE_HIDPI_IMAGES": "YES",
+    "CURRENT_PROJECT_VERSION": "1",
+    "GENERATE_INFOPLIST_FILE": "YES",
+    "INFOPLIST_KEY_LSApplicationCategoryType": '"public.app-category.productivity"',
+    "INFOPLIST_KEY_NSHumanReadableCopyright": '""',
+    "INFOPLIST_KEY_NSPrincipalClass": "NSApplication",
+    "MARKETING_VERSION": "1.0",
+    "MACOS_DEPLOYMENT_TARGET": MACOS_DEPLOY,
+    "IPHONEOS_DEPLOYMENT_TARGET": IOS_DEPLOY,
+    "PRODUCT_BUNDLE_IDENTIFIER": f'"{BUNDLE_ID_BASE}"',
+    "PRODUCT_NAME": '"$(TARGET_NAME)"',
+    "SDKROOT": "auto",
+    "SUPPORTED_PLATFORMS": '"macosx iphoneos iphonesimulator"',
+    "SWIFT_EMIT_LOC_STRINGS": "YES",
+    "SWIFT_VERSION": SWIFT_VERSION,
+    "TARGETED_DEVICE_FAMILY": '"1,2"',
+}
+
+# Settings bodies rendered once at load; each configuration is then a
+# single template fill with its name and UUID
+_PROJECT_BLOCKS = {name: _settings_block(settings) for name, settings in _PROJECT_SETTINGS.items()}
+_TARGET_COMMON  = _settings_block(_TARGET_SETTINGS)
+
+# Static section skeletons, filled in with a single str.format() per section
+_FRAMEWORKS_PHASE_TMPL = """\
+\n/* Begin PBXFrameworksBuildPhase section */
+\t\t{frameworks_phase_uuid} /* Frameworks */ = {{
+\t\t\tisa = PBXFrameworksBuildPhase;
+\t\t\tbuildActionMask = 2147483647;
+\t\t\tfiles = (
+\t\t\t\t{swiftdata_build_uuid} /* SwiftData.framework in Frameworks */,
+\t\t\t);
+\t\t\trunOnlyForDeploymentPostprocessing = 0;
+\t\t}};
+/* End PBXFrameworksBuildPhase section */
+"""
+
+_PRODUCTS_GROUP_TMPL = """\
+\t\t{products_group_uuid} /* Products */ = {{
+\t\t\tisa = PBXGroup;
+\t\t\tchildren = (
+\t\t\t\t{product_ref_uuid} /* {app_name}.app */,
+\t\t\t);
+\t\t\tname = Products;
+\t\t\tsourceTree = "<group>";
+\t\t}};
+/* End PBXGroup section */
+"""
+
+_NATIVE_TARGET_TMPL = """\
+\n/* Begin PBXNativeTarget section */
+\t\t{target_uuid} /* {app_name} */ = {{
+\t\t\tisa = PBXNativeTarget;
+\t\t\tbuildConfigurationList = {target_cfglist_uuid} /* Build configuration list for PBXNativeTarget "{app_name}" */;
+\t\t\tbuildPhases = (
+\t\t\t\t{sources_phase_uuid} /* Sources */,
+\t\t\t\t{resources_phase_uuid} /* Resources */,
+\t\t\t\t{frameworks_phase_uuid} /* Frameworks */,
+\t\t\t);
+\t\t\tbuildRules = (
+\t\t\t);
+\t\t\tdependencies = (
+\t\t\t);
+\t\t\tname = {app_name};
+\t\t\tpackageProductDependencies = (
+\t\t\t);
+\t\t\tproductName = {app_name};
+\t\t\tproductReference = {product_ref_uuid} /* {app_name}.app */;
+\t\t\tproductType = "com.apple.product-type.application";
+\t\t}};
+/* End PBXNativeTarget section */
+"""
+
+_PBXPROJECT_TMPL = """\
+\n/* Begin PBXProject section */
+\t\t{project_uuid} /* Project object */ = {{
+\t\t\tisa = PBXProject;
+\t\t\tattributes = {{
+\t\t\t\tBuildIndependentTargetsInParallel = 1;
+\t\t\t\tLastSwiftUpdateCheck = 1500;
+\t\t\t\tLastUpgradeCheck = 1500;
+\t\t\t\tTargetAttributes = {{
+\t\t\t\t\t{target_uuid} = {{
+\t\t\t\t\t\tCreatedOnToolsVersion = 15.0;
+\t\t\t\t\t}};
+\t\t\t\t}};
+\t\t\t}};
+\t\t\tbuildConfigurationList = {project_cfglist_uuid} /* Build configuration list for PBXProject "{app_name}" */;
+\t\t\tcompatibilityVersion = "Xcode 15.0";
+\t\t\tdevelopmentRegion = en;
+\t\t\thasScannedForEncodings = 0;
+\t\t\tknownRegions = (
+\t\t\t\ten,
+\t\t\t\tBase,
+\t\t\t);
+\t\t\tmainGroup = {main_group_uuid};
+\t\t\tproductRefGroup = {products_group_uuid} /* Products */;
+\t\t\tprojectDirPath = "";
+\t\t\tprojectRoot = "";
+\t\t\ttargets = (
+\t\t\t\t{target_uuid} /* {app_name} */,
+\t\t\t);
+\t\t}};
+/* End PBXProject section */
+"""
+
+_RESOURCES_PHASE_TMPL = """\
+\n/* Begin PBXResourcesBuildPhase section */
+\t\t{resources_phase_uuid} /* Resources */ = {{
+\t\t\tisa = PBXResourcesBuildPhase;
+\t\t\tbuildActionMask = 2147483647;
+\t\t\tfiles = (
+{files}\t\t\t);
+\t\t\trunOnlyForDeploymentPostprocessing = 0;
+\t\t}};
+/* End PBXResourcesBuildPhase section */
+"""
+
+_CFGLIST_TMPL = """\
+\t\t{uid} /* Build configuration list for {isa} "{app_name}" */ = {{
+\t\t\tisa = XCConfigurationList;
+\t\t\tbuildConfigurations = (
+\t\t\t\t{debug_uuid} /* Debug */,
+\t\t\t\t{release_uuid} /* Release */,
+\t\t\t);
+\t\t\tdefaultConfigurationIsVisible = 0;
+\t\t\tdefaultConfigurationName = Release;
+\t\t}};
+"""
 
 def pbxproj():
-    lines = []
-    lines.append("// !$*UTF8*$!")
-    lines.append("{")
-    lines.append("\tarchiveVersion = 1;")
-    lines.append("\tclasses = {")
-    lines.append("\t};")
-    lines.append("\tobjectVersion = 77;")
-    lines.append("\tobjects = {")
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w("// !$*UTF8*$!\n"
+      "{\n"
+      "\tarchiveVersion = 1;\n"
+      "\tclasses = {\n"
+      "\t};\n"
+      "\tobjectVersion = 77;\n"
+      "\tobjects = {\n"
+      "\n")
 
     # --- PBXBuildFile ---
-    lines.append("\n/* Begin PBXBuildFile section */")
-    for path, uid in build_files.items():
-        name = os.path.basename(path)
-        lines.append(f"\t\t{uid} /* {name} in Sources */ = {{isa = PBXBuildFile; fileRef = {file_refs[path]} /* {name} */; }};")
-    lines.append(f"\t\t{SWIFTDATA_BUILD_UUID} /* SwiftData.framework in Frameworks */ = {{isa = PBXBuildFile; fileRef = {SWIFTDATA_FW_REF_UUID} /* SwiftData.framework */; }};")
-    lines.append("/* End PBXBuildFile section */")
+    w("\n/* Begin PBXBuildFile section */\n")
+    for path, name, fr_uid, bf_uid in _FILE_ENTRIES:
+        w(_BUILDFILE_TMPL.format_map({"uid": bf_uid, "name": name, "ref": fr_uid}))
+    w(f"\t\t{SWIFTDATA_BUILD_UUID} /* SwiftData.framework in Frameworks */ = {{isa = PBXBuildFile; fileRef = {SWIFTDATA_FW_REF_UUID} /* SwiftData.framework */; }};\n"
+      "/* End PBXBuildFile section */\n")
 
     # --- PBXFileReference ---
-    lines.append("\n/* Begin PBXFileReference section */")
-    for path, uid in file_refs.items():
-        name = os.path.basename(path)
+    w("\n/* Begin PBXFileReference section */\n")
+    for path, name, fr_uid, bf_uid in _FILE_ENTRIES:
         if path.endswith(".swift"):
-            lines.append(f"\t\t{uid} /* {name} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; name = {name}; path = {path}; sourceTree = \"<group>\"; }};")
+            file_type = "sourcecode.swift"
         elif path.endswith(".xcassets"):
-            lines.append(f"\t\t{uid} /* {name} */ = {{isa = PBXFileReference; lastKnownFileType = folder.assetcatalog; name = {name}; path = {path}; sourceTree = \"<group>\"; }};")
-    lines.append(f"\t\t{PRODUCT_REF_UUID} /* {APP_NAME}.app */ = {{isa = PBXFileReference; explicitFileType = wrapper.application; includeInIndex = 0; path = {APP_NAME}.app; sourceTree = BUILT_PRODUCTS_DIR; }};")
-    lines.append(f"\t\t{SWIFTDATA_FW_REF_UUID} /* SwiftData.framework */ = {{isa = PBXFileReference; lastKnownFileType = wrapper.framework; name = SwiftData.framework; path = System/Library/Frameworks/SwiftData.framework; sourceTree = SDKROOT; }};")
-    lines.append("/* End PBXFileReference section */")
+            file_type = "folder.assetcatalog"
+        else:
+            continue
+        w(_FILEREF_TMPL.format_map({"uid": fr_uid, "name": name, "path": path, "file_type": file_type}))
+    w(f"\t\t{PRODUCT_REF_UUID} /* {APP_NAME}.app */ = {{isa = PBXFileReference; explicitFileType = wrapper.application; includeInIndex = 0; path = {APP_NAME}.app; sourceTree = BUILT_PRODUCTS_DIR; }};\n"
+      f"\t\t{SWIFTDATA_FW_REF_UUID} /* SwiftData.framework */ = {{isa = PBXFileReference; lastKnownFileType = wrapper.framework; name = SwiftData.framework; path = System/Library/Frameworks/SwiftData.framework; sourceTree = SDKROOT; }};\n"
+      "/* End PBXFileReference section */\n")
 
     # --- PBXFrameworksBuildPhase ---
-    lines.append("\n/* Begin PBXFrameworksBuildPhase section */")
-    lines.append(f"\t\t{FRAMEWORKS_PHASE_UUID} /* Frameworks */ = {{")
-    lines.append(f"\t\t\tisa = PBXFrameworksBuildPhase;")
-    lines.append(f"\t\t\tbuildActionMask = 2147483647;")
-    lines.append(f"\t\t\tfiles = (")
-    lines.append(f"\t\t\t\t{SWIFTDATA_BUILD_UUID} /* SwiftData.framework in Frameworks */,")
-    lines.append(f"\t\t\t);")
-    lines.append(f"\t\t\trunOnlyForDeploymentPostprocessing = 0;")
-    lines.append(f"\t\t}};")
-    lines.append("/* End PBXFrameworksBuildPhase section */")
+    w(_FRAMEWORKS_PHASE_TMPL.format(frameworks_phase_uuid=FRAMEWORKS_PHASE_UUID,
+                                    swiftdata_build_uuid=SWIFTDATA_BUILD_UUID))
 
     # --- PBXGroup ---
-    lines.append("\n/* Begin PBXGroup section */")
+    w("\n/* Begin PBXGroup section */\n")
 
     # Main group
-    lines.append(f"\t\t{MAIN_GROUP_UUID} = {{")
-    lines.append(f"\t\t\tisa = PBXGroup;")
-    lines.append(f"\t\t\tchildren = (")
-    for path, uid in file_refs.items():
-        name = os.path.basename(path)
-        lines.append(f"\t\t\t\t{uid} /* {name} */,")
-    lines.append(f"\t\t\t\t{PRODUCTS_GROUP_UUID} /* Products */,")
-    lines.append(f"\t\t\t\t{SWIFTDATA_FW_REF_UUID} /* SwiftData.framework */,")
-    lines.append(f"\t\t\t);")
-    lines.append(f"\t\t\tsourceTree = \"<group>\";")
-    lines.append(f"\t\t}};")
+    w(f"\t\t{MAIN_GROUP_UUID} = {{\n"
+      "\t\t\tisa = PBXGroup;\n"
+      "\t\t\tchildren = (\n")
+    for path, name, fr_uid, bf_uid in _FILE_ENTRIES:
+        w(_GROUP_CHILD_TMPL.format_map({"uid": fr_uid, "name": name}))
+    w(f"\t\t\t\t{PRODUCTS_GROUP_UUID} /* Products */,\n"
+      f"\t\t\t\t{SWIFTDATA_FW_REF_UUID} /* SwiftData.framework */,\n"
+      "\t\t\t);\n"
+      "\t\t\tsourceTree = \"<group>\";\n"
+      "\t\t};\n")
 
     # Products group
-    lines.append(f"\t\t{PRODUCTS_GROUP_UUID} /* Products */ = {{")
-    lines.append(f"\t\t\tisa = PBXGroup;")
-    lines.append(f"\t\t\tchildren = (")
-    lines.append(f"\t\t\t\t{PRODUCT_REF_UUID} /* {APP_NAME}.app */,")
-    lines.append(f"\t\t\t);")
-    lines.append(f"\t\t\tname = Products;")
-    lines.append(f"\t\t\tsourceTree = \"<group>\";")
-    lines.append(f"\t\t}};")
-    lines.append("/* End PBXGroup section */")
+    w(_PRODUCTS_GROUP_TMPL.format(products_group_uuid=PRODUCTS_GROUP_UUID,
+                                  product_ref_uuid=PRODUCT_REF_UUID, app_name=APP_NAME))
 
     # --- PBXNativeTarget ---
-    lines.append("\n/* Begin PBXNativeTarget section */")
-    lines.append(f"\t\t{TARGET_UUID} /* {APP_NAME} */ = {{")
-    lines.append(f"\t\t\tisa = PBXNativeTarget;")
-    lines.append(f"\t\t\tbuildConfigurationList = {TARGET_CFGLIST_UUID} /* Build configuration list for PBXNativeTarget \"{APP_NAME}\" */;")
-    lines.append(f"\t\t\tbuildPhases = (")
-    lines.append(f"\t\t\t\t{SOURCES_PHASE_UUID} /* Sources */,")
-    lines.append(f"\t\t\t\t{RESOURCES_PHASE_UUID} /* Resources */,")
-    lines.append(f"\t\t\t\t{FRAMEWORKS_PHASE_UUID} /* Frameworks */,")
-    lines.append(f"\t\t\t);")
-    lines.append(f"\t\t\tbuildRules = (")
-    lines.append(f"\t\t\t);")
-    lines.append(f"\t\t\tdependencies = (")
-    lines.append(f"\t\t\t);")
-    lines.append(f"\t\t\tname = {APP_NAME};")
-    lines.append(f"\t\t\tpackageProductDependencies = (")
-    lines.append(f"\t\t\t);")
-    lines.append(f"\t\t\tproductName = {APP_NAME};")
-    lines.append(f"\t\t\tproductReference = {PRODUCT_REF_UUID} /* {APP_NAME}.app */;")
-    lines.append(f"\t\t\tproductType = \"com.apple.product-type.application\";")
-    lines.append(f"\t\t}};")
-    lines.append("/* End PBXNativeTarget section */")
+    w(_NATIVE_TARGET_TMPL.format(target_uuid=TARGET_UUID, target_cfglist_uuid=TARGET_CFGLIST_UUID,
+                                 sources_phase_uuid=SOURCES_PHASE_UUID,
+                                 resources_phase_uuid=RESOURCES_PHASE_UUID,
+                                 frameworks_phase_uuid=FRAMEWORKS_PHASE_UUID,
+                                 product_ref_uuid=PRODUCT_REF_UUID, app_name=APP_NAME))
 
     # --- PBXProject ---
-    lines.append("\n/* Begin PBXProject section */")
-    lines.append(f"\t\t{PROJECT_UUID} /* Project object */ = {{")
-    lines.append(f"\t\t\tisa = PBXProject;")
-    lines.append(f"\t\t\tattributes = {{")
-    lines.append(f"\t\t\t\tBuildIndependentTargetsInParallel = 1;")
-    lines.append(f"\t\t\t\tLastSwiftUpdateCheck = 1500;")
-    lines.append(f"\t\t\t\tLastUpgradeCheck = 1500;")
-    lines.append(f"\t\t\t\tTargetAttributes = {{")
-    lines.append(f"\t\t\t\t\t{TARGET_UUID} = {{")
-    lines.append(f"\t\t\t\t\t\tCreatedOnToolsVersion = 15.0;")
-    lines.append(f"\t\t\t\t\t}};")
-    lines.append(f"\t\t\t\t}};")
-    lines.append(f"\t\t\t}};")
-    lines.append(f"\t\t\tbuildConfigurationList = {PROJECT_CFGLIST_UUID} /* Build configuration list for PBXProject \"{APP_NAME}\" */;")
-    lines.append(f"\t\t\tcompatibilityVersion = \"Xcode 15.0\";")
-    lines.append(f"\t\t\tdevelopmentRegion = en;")
-    lines.append(f"\t\t\thasScannedForEncodings = 0;")
-    lines.append(f"\t\t\tknownRegions = (")
-    lines.append(f"\t\t\t\ten,")
-    lines.append(f"\t\t\t\tBase,")
-    lines.append(f"\t\t\t);")
-    lines.append(f"\t\t\tmainGroup = {MAIN_GROUP_UUID};")
-    lines.append(f"\t\t\tproductRefGroup = {PRODUCTS_GROUP_UUID} /* Products */;")
-    lines.append(f"\t\t\tprojectDirPath = \"\";")
-    lines.append(f"\t\t\tprojectRoot = \"\";")
-    lines.append(f"\t\t\ttargets = (")
-    lines.append(f"\t\t\t\t{TARGET_UUID} /* {APP_NAME} */,")
-    lines.append(f"\t\t\t);")
-    lines.append(f"\t\t}};")
-    lines.append("/* End PBXProject section */")
+    w(_PBXPROJECT_TMPL.format(project_uuid=PROJECT_UUID, target_uuid=TARGET_UUID,
+                              project_cfglist_uuid=PROJECT_CFGLIST_UUID,
+                              main_group_uuid=MAIN_GROUP_UUID,
+                              products_group_uuid=PRODUCTS_GROUP_UUID, app_name=APP_NAME))
 
     # --- PBXResourcesBuildPhase ---
-    lines.append("\n/* Begin PBXResourcesBuildPhase section */")
-    lines.append(f"\t\t{RESOURCES_PHASE_UUID} /* Resources */ = {{")
-    lines.append(f"\t\t\tisa = PBXResourcesBuildPhase;")
-    lines.append(f"\t\t\tbuildActionMask = 2147483647;")
-    lines.append(f"\t\t\tfiles = (")
     # Add assets to resources
+    resources = ""
     if ASSETS_XCASSETS in build_files:
         name = os.path.basename(ASSETS_XCASSETS)
-        lines.append(f"\t\t\t\t{build_files[ASSETS_XCASSETS]} /* {name} in Resources */,")
-    lines.append(f"\t\t\t);")
-    lines.append(f"\t\t\trunOnlyForDeploymentPostprocessing = 0;")
-    lines.append(f"\t\t}};")
-    lines.append("/* End PBXResourcesBuildPhase section */")
+        resources = f"\t\t\t\t{build_files[ASSETS_XCASSETS]} /* {name} in Resources */,\n"
+    w(_RESOURCES_PHASE_TMPL.format(resources_phase_uuid=RESOURCES_PHASE_UUID, files=resources))
 
     # --- PBXSourcesBuildPhase ---
-    lines.append("\n/* Begin PBXSourcesBuildPhase section */")
-    lines.append(f"\t\t{SOURCES_PHASE_UUID} /* Sources */ = {{")
-    lines.append(f"\t\t\tisa = PBXSourcesBuildPhase;")
-    lines.append(f"\t\t\tbuildActionMask = 2147483647;")
-    lines.append(f"\t\t\tfiles = (")
-    for path in SOURCE_FILES:
-        name = os.path.basename(path)
-        lines.append(f"\t\t\t\t{build_files[path]} /* {name} in Sources */,")
-    lines.append(f"\t\t\t);")
-    lines.append(f"\t\t\trunOnlyForDeploymentPostprocessing = 0;")
-    lines.append(f"\t\t}};")
-    lines.append("/* End PBXSourcesBuildPhase section */")
+    w("\n/* Begin PBXSourcesBuildPhase section */\n"
+      f"\t\t{SOURCES_PHASE_UUID} /* Sources */ = {{\n"
+      "\t\t\tisa = PBXSourcesBuildPhase;\n"
+      "\t\t\tbuildActionMask = 2147483647;\n"
+      "\t\t\tfiles = (\n")
+    for path, name, fr_uid, bf_uid in _FILE_ENTRIES[:len(SOURCE_FILES)]:
+        w(_SOURCES_FILE_TMPL.format_map({"uid": bf_uid, "name": name}))
+    w("\t\t\t);\n"
+      "\t\t\trunOnlyForDeploymentPostprocessing = 0;\n"
+      "\t\t};\n"
+      "/* End PBXSourcesBuildPhase section */\n")
 
     # --- XCBuildConfiguration ---
-    lines.append("\n/* Begin XCBuildConfiguration section */")
-
-    # Project Debug
-    lines.append(f"\t\t{DEBUG_CONFIG_UUID} /* Debug */ = {{")
-    lines.append(f"\t\t\tisa = XCBuildConfiguration;")
-    lines.append(f"\t\t\tbuildSettings = {{")
-    lines.append(f"\t\t\t\tALWAYS_SEARCH_USER_PATHS = NO;")
-    lines.append(f"\t\t\t\tCLANG_ENABLE_MODULES = YES;")
-    lines.append(f"\t\t\t\tCOPY_PHASE_STRIP = NO;")
-    lines.append(f"\t\t\t\tDEBUG_INFORMATION_FORMAT = dwarf;")
-    lines.append(f"\t\t\t\tENABLE_STRICT_OBJC_MSGSEND = YES;")
-    lines.append(f"\t\t\t\tENABLE_TESTABILITY = YES;")
-    lines.append(f"\t\t\t\tGCC_C_LANGUAGE_STANDARD = gnu17;")
-    lines.append(f"\t\t\t\tGCC_DYNAMIC_NO_PIC = NO;")
-    lines.append(f"\t\t\t\tGCC_OPTIMIZATION_LEVEL = 0;")
-    lines.append(f"\t\t\t\tGCC_PREPROCESSOR_DEFINITIONS = (\"DEBUG=1\", \"$(inherited)\");")
-    lines.append(f"\t\t\t\tMTL_ENABLE_DEBUG_INFO = INCLUDE_SOURCE;")
-    lines.append(f"\t\t\t\tMTL_FAST_MATH = YES;")
-    lines.append(f"\t\t\t\tONLY_ACTIVE_ARCH = YES;")
-    lines.append(f"\t\t\t\tSWIFT_ACTIVE_COMPILATION_CONDITIONS = DEBUG;")
-    lines.append(f"\t\t\t\tSWIFT_OPTIMIZATION_LEVEL = \"-Onone\";")
-    lines.append(f"\t\t\t}};")
-    lines.append(f"\t\t\tname = Debug;")
-    lines.append(f"\t\t}};")
-
-    # Project Release
-    lines.append(f"\t\t{RELEASE_CONFIG_UUID} /* Release */ = {{")
-    lines.append(f"\t\t\tisa = XCBuildConfiguration;")
-    lines.append(f"\t\t\tbuildSettings = {{")
-    lines.append(f"\t\t\t\tALWAYS_SEARCH_USER_PATHS = NO;")
-    lines.append(f"\t\t\t\tCLANG_ENABLE_MODULES = YES;")
-    lines.append(f"\t\t\t\tCOPY_PHASE_STRIP = NO;")
-    lines.append(f"\t\t\t\tDEBUG_INFORMATION_FORMAT = \"dwarf-with-dsym\";")
-    lines.append(f"\t\t\t\tENABLE_NS_ASSERTIONS = NO;")
-    lines.append(f"\t\t\t\tENABLE_STRICT_OBJC_MSGSEND = YES;")
-    lines.append(f"\t\t\t\tGCC_C_LANGUAGE_STANDARD = gnu17;")
-    lines.append(f"\t\t\t\tMTL_ENABLE_DEBUG_INFO = NO;")
-    lines.append(f"\t\t\t\tMTL_FAST_MATH = YES;")
-    lines.append(f"\t\t\t\tSWIFT_COMPILATION_MODE = wholemodule;")
-    lines.append(f"\t\t\t\tSWIFT_OPTIMIZATION_LEVEL = \"-O\";")
-    lines.append(f"\t\t\t}};")
-    lines.append(f"\t\t\tname = Release;")
-    lines.append(f"\t\t}};")
-
-    # Target Debug
-    lines.append(f"\t\t{TARGET_DEBUG_CFG_UUID} /* Debug */ = {{")
-    lines.append(f"\t\t\tisa = XCBuildConfiguration;")
-    lines.append(f"\t\t\tbuildSettings = {{")
-    lines.append(f"\t\t\t\tASSETCATALOG_COMPILER_APPICON_NAME = AppIcon;")
-    lines.append(f"\t\t\t\tASSETCATALOG_COMPILER_GLOBAL_ACCENT_COLOR_NAME = AccentColor;")
-    lines.append(f"\t\t\t\tCOMBINE_HIDPI_IMAGES = YES;")
-    lines.append(f"\t\t\t\tCURRENT_PROJECT_VERSION = 1;")
-    lines.append(f"\t\t\t\tGENERATE_INFOPLIST_FILE = YES;")
-    lines.append(f"\t\t\t\tINFOPLIST_KEY_LSApplicationCategoryType = \"public.app-category.productivity\";")
-    lines.append(f"\t\t\t\tINFOPLIST_KEY_NSHumanReadableCopyright = \"\";")
-    lines.append(f"\t\t\t\tINFOPLIST_KEY_NSPrincipalClass = NSApplication;")
-    lines.append(f"\t\t\t\tMARKETING_VERSION = 1.0;")
-    lines.append(f"\t\t\t\tMACOS_DEPLOYMENT_TARGET = {MACOS_DEPLOY};")
-    lines.append(f"\t\t\t\tIPHONEOS_DEPLOYMENT_TARGET = {IOS_DEPLOY};")
-    lines.append(f"\t\t\t\tPRODUCT_BUNDLE_IDENTIFIER = \"{BUNDLE_ID_BASE}\";")
-    lines.append(f"\t\t\t\tPRODUCT_NAME = \"$(TARGET_NAME)\";")
-    lines.append(f"\t\t\t\tSDKROOT = auto;")
-    lines.append(f"\t\t\t\tSUPPORTED_PLATFORMS = \"macosx iphoneos iphonesimulator\";")
-    lines.append(f"\t\t\t\tSWIFT_EMIT_LOC_STRINGS = YES;")
-    lines.append(f"\t\t\t\tSWIFT_VERSION = {SWIFT_VERSION};")
-    lines.append(f"\t\t\t\tTARGETED_DEVICE_FAMILY = \"1,2\";")
-    lines.append(f"\t\t\t}};")
-    lines.append(f"\t\t\tname = Debug;")
-    lines.append(f"\t\t}};")
-
-    # Target Release
-    lines.append(f"\t\t{TARGET_RELEASE_CFG_UUID} /* Release */ = {{")
-    lines.append(f"\t\t\tisa = XCBuildConfiguration;")
-    lines.append(f"\t\t\tbuildSettings = {{")
-    lines.append(f"\t\t\t\tASSETCATALOG_COMPILER_APPICON_NAME = AppIcon;")
-    lines.append(f"\t\t\t\tASSETCATALOG_COMPILER_GLOBAL_ACCENT_COLOR_NAME = AccentColor;")
-    lines.append(f"\t\t\t\tCOMBINE_HIDPI_IMAGES = YES;")
-    lines.append(f"\t\t\t\tCURRENT_PROJECT_VERSION = 1;")
-    lines.append(f"\t\t\t\tGENERATE_INFOPLIST_FILE = YES;")
-    lines.append(f"\t\t\t\tINFOPLIST_KEY_LSApplicationCategoryType = \"public.app-category.productivity\";")
-    lines.append(f"\t\t\t\tINFOPLIST_KEY_NSHumanReadableCopyright = \"\";")
-    lines.append(f"\t\t\t\tINFOPLIST_KEY_NSPrincipalClass = NSApplication;")
-    lines.append(f"\t\t\t\tMARKETING_VERSION = 1.0;")
-    lines.append(f"\t\t\t\tMACOS_DEPLOYMENT_TARGET = {MACOS_DEPLOY};")
-    lines.append(f"\t\t\t\tIPHONEOS_DEPLOYMENT_TARGET = {IOS_DEPLOY};")
-    lines.append(f"\t\t\t\tPRODUCT_BUNDLE_IDENTIFIER = \"{BUNDLE_ID_BASE}\";")
-    lines.append(f"\t\t\t\tPRODUCT_NAME = \"$(TARGET_NAME)\";")
-    lines.append(f"\t\t\t\tSDKROOT = auto;")
-    lines.append(f"\t\t\t\tSUPPORTED_PLATFORMS = \"macosx iphoneos iphonesimulator\";")
-    lines.append(f"\t\t\t\tSWIFT_EMIT_LOC_STRINGS = YES;")
-    lines.append(f"\t\t\t\tSWIFT_VERSION = {SWIFT_VERSION};")
-    lines.append(f"\t\t\t\tTARGETED_DEVICE_FAMILY = \"1,2\";")
-    lines.append(f"\t\t\t}};")
-    lines.append(f"\t\t\tname = Release;")
-    lines.append(f"\t\t}};")
-
-    lines.append("/* End XCBuildConfiguration section */")
+    w("\n/* Begin XCBuildConfiguration section */\n")
+
+    for name, uid in (("Debug", DEBUG_CONFIG_UUID), ("Release", RELEASE_CONFIG_UUID)):
+        w(_XCCONFIG_TMPL.format(uid=uid, name=name, settings=_PROJECT_BLOCKS[name]))
+    for name, uid in (("Debug", TARGET_DEBUG_CFG_UUID), ("Release", TARGET_RELEASE_CFG_UUID)):
+        w(_XCCONFIG_TMPL.format(uid=uid, name=name, settings=_TARGET_COMMON))
+
+    w("/* End XCBuildConfiguration section */\n")
 
     # --- XCConfigurationList ---
-    lines.append("\n/* Begin XCConfigurationList section */")
-    lines.append(f"\t\t{PROJECT_CFGLIST_UUID} /* Build configuration list for PBXProject \"{APP_NAME}\" */ = {{")
-    lines.append(f"\t\t\tisa = XCConfigurationList;")
-    lines.append(f"\t\t\tbuildConfigurations = (")
-    lines.append(f"\t\t\t\t{DEBUG_CONFIG_UUID} /* Debug */,")
-    lines.append(f"\t\t\t\t{RELEASE_CONFIG_UUID} /* Release */,")
-    lines.append(f"\t\t\t);")
-    lines.append(f"\t\t\tdefaultConfigurationIsVisible = 0;")
-    lines.append(f"\t\t\tdefaultConfigurationName = Release;")
-    lines.append(f"\t\t}};")
-    lines.append(f"\t\t{TARGET_CFGLIST_UUID} /* Build configuration list for PBXNativeTarget \"{APP_NAME}\" */ = {{")
-    lines.append(f"\t\t\tisa = XCConfigurationList;")
-    lines.append(f"\t\t\tbuildConfigurations = (")
-    lines.append(f"\t\t\t\t{TARGET_DEBUG_CFG_UUID} /* Debug */,")
-    lines.append(f"\t\t\t\t{TARGET_RELEASE_CFG_UUID} /* Release */,")
-    lines.append(f"\t\t\t);")
-    lines.append(f"\t\t\tdefaultConfigurationIsVisible = 0;")
-    lines.append(f"\t\t\tdefaultConfigurationName = Release;")
-    lines.append(f"\t\t}};")
-    lines.append("/* End XCConfigurationList section */")
-
-    lines.append("\t};")
-    lines.append(f"\trootObject = {PROJECT_UUID} /* Project object */;")
-    lines.append("}")
-
-    return "\n".join(lines)
+    w("\n/* Begin XCConfigurationList section */\n")
+    w(_CFGLIST_TMPL.format(uid=PROJECT_CFGLIST_UUID, isa="PBXProject", app_name=APP_NAME,
+                           debug_uuid=DEBUG_CONFIG_UUID, release_uuid=RELEASE_CONFIG_UUID))
+    w(_CFGLIST_TMPL.format(uid=TARGET_CFGLIST_UUID, isa="PBXNativeTarget", app_name=APP_NAME,
+                           debug_uuid=TARGET_DEBUG_CFG_UUID, release_uuid=TARGET_RELEASE_CFG_UUID))
+    w("/* End XCConfigurationList section */\n")
+
+    w("\t};\n"
+      f"\trootObject = {PROJECT_UUID} /* Project object */;\n"
+      "}")
+
+    return buf.getvalue()
 
 # ---------------------------------------------------------------------------
 # Asset catalog stubs
 # ---------------------------------------------------------------------------
 
+# Contents are static, so they're serialized once at load
+_CATALOG_ROOT_JSON = json.dumps({"info": {"author": "xcode", "version": 1}}, indent=2).encode("utf-8")
+
+# AppIcon Contents.json — empty images list avoids "unassigned child" warnings.
+# Add real .png icon files here only once you have artwork.
+_APPICON_JSON = json.dumps({
+    "images": [],
+    "info": {"author": "xcode", "version": 1}
+}, indent=2).encode("utf-8")
+
+_ACCENT_JSON = json.dumps({
+    "colors": [{"idiom": "universal", "color": {"color-space": "srgb",
+                "components": {"red": "0.337", "green": "0.333", "blue": "0.996", "alpha": "1.000"}}}],
+    "info": {"author": "xcode", "version": 1}
+}, indent=2).encode("utf-8")
+
 def create_asset_catalog():
     base = "EMCopilot/Resources/Assets.xcassets"
     os.makedirs(base, exist_ok=True)
@@ -405,26 +490,15 @@ def create_asset_catalog():
     os.makedirs(f"{base}/AccentColor.colorset", exist_ok=True)
 
     # Contents.json for catalog root
-    with open(f"{base}/Contents.json", "w") as f:
-        json.dump({"info": {"author": "xcode", "version": 1}}, f, indent=2)
-
-    # AppIcon Contents.json — empty images list avoids "unassigned child" warnings.
-    # Add real .png icon files here only once you have artwork.
-    appicon_contents = {
-        "images": [],
-        "info": {"author": "xcode", "version": 1}
-    }
-    with open(f"{base}/AppIcon.appiconset/Contents.json", "w") as f:
-        json.dump(appicon_contents, f, indent=2)
+    with open(f"{base}/Contents.json", "wb") as f:
+        f.write(_CATALOG_ROOT_JSON)
+
+    with open(f"{base}/AppIcon.appiconset/Contents.json", "wb") as f:
+        f.write(_APPICON_JSON)
 
     # AccentColor
-    accent_contents = {
-        "colors": [{"idiom": "universal", "color": {"color-space": "srgb",
-                    "components": {"red": "0.337", "green": "0.333", "blue": "0.996", "alpha": "1.000"}}}],
-        "info": {"author": "xcode", "version": 1}
-    }
-    with open(f"{base}/AccentColor.colorset/Contents.json", "w") as f:
-        json.dump(accent_contents, f, indent=2)
+    with open(f"{base}/AccentColor.colorset/Contents.json", "wb") as f:
+        f.write(_ACCENT_JSON)
 
     print(f"  ✓ Created {base}")
 
@@ -438,21 +512,30 @@ def main():
     proj_dir = "EMCopilot.xcodeproj"
     os.makedirs(proj_dir, exist_ok=True)
 
-    # Write project.pbxproj
     proj_path = os.path.join(proj_dir, "project.pbxproj")
-    content = pbxproj()
-    with open(proj_path, "w") as f:
-        f.write(content)
-    print(f"  ✓ Created {proj_path}")
+    key = cache_key()
+    # The key doesn't cover the asset catalog, so its presence is checked too
+    if (_cache.get("key") == key and os.path.exists(proj_path)
+            and os.path.isdir(ASSETS_XCASSETS)):
+        print(f"  ✓ {proj_path} is up to date")
+    else:
+        # Write project.pbxproj
+        data = pbxproj().encode("utf-8")
+        with open(proj_path, "wb") as f:
+            f.write(data)
+        save_cache(key)
+        print(f"  ✓ Created {proj_path}")
 
-    # Create asset catalog
-    create_asset_catalog()
+        # Create asset catalog
+        create_asset_catalog()
 
     # Verify all source files exist
     print("\n📋 Checking source files…")
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        exists = list(ex.map(os.path.exists, SOURCE_FILES))
     missing = []
-    for path in SOURCE_FILES:
-        if os.path.exists(path):
+    for path, ok in zip(SOURCE_FILES, exists):
+        if ok:
             print(f"  ✓ {path}")
         else:
             print(f"  ✗ MISSING: {path}")